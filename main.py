@@ -6,13 +6,64 @@ Traverse specified folders, read all TensorBoard event files, and generate a com
 
 import os
 import argparse
+import struct
+import multiprocessing
+from functools import partial
 from pathlib import Path
 from collections import defaultdict
+import sys
 import numpy as np
 import itertools
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
+import operator
+from tensorboard.backend.event_processing.directory_watcher import DirectoryDeletedError
 from tensorboard.backend.event_processing.event_accumulator import EventAccumulator
+from tensorboard.compat import tf
+
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm is optional; loading then runs without a progress bar
+    tqdm = None
+
+try:
+    # Replace the pure-Python CRC32C used to verify event records with the
+    # hardware-accelerated implementation from the optional crc32c package
+    import crc32c as _crc32c
+    from tensorboard.compat.tensorflow_stub import pywrap_tensorflow as _pywrap_tensorflow
+
+    _pywrap_tensorflow.crc32c = _crc32c.crc32c
+except ImportError:
+    pass
+
+# Keep every scalar event but at most one event per tag for all other
+# payload types, which this tool never reads
+SCALARS_ONLY_SIZE_GUIDANCE = {
+    "scalars": 0,
+    "images": 1,
+    "audio": 1,
+    "histograms": 1,
+    "compressedHistograms": 1,
+    "tensors": 1,
+}
+
+# Rendering settings for long polylines, applied only while the figure is drawn
+RENDER_RC_PARAMS = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# (lfilter, lfilter_zi) from scipy.signal, False if scipy is not installed, or
+# None until smooth_values first needs it; scipy is slow to import, so it is
+# only loaded when an EMA is actually computed
+_scipy_lfilter = None
+
+# Numba-compiled _ema_core, False if numba is not installed, or None until the
+# EMA fallback first runs; numba is only needed when scipy is missing
+_ema_core_jit = None
+
+# Series up to this length are smoothed with the closed-form EMA, where
+# building the power table is cheaper than a recurrence or filter call
+EMA_DOT_MAX_POINTS = 64
 
 
 def find_tb_files(directories):
@@ -25,23 +76,135 @@ def find_tb_files(directories):
     Returns:
         list of event file paths
     """
+    # (name, is_dir) listings per directory, so that overlapping input
+    # directories are only listed once within this call
+    listings = {}
+
     tb_files = []
     for directory in directories:
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            print(f"Warning: directory does not exist: {directory}")
-            continue
-
-        # Recursively find all events files
-        for root, dirs, files in os.walk(dir_path):
-            for file in files:
-                if file.startswith("events.out.tfevents"):
-                    tb_files.append(os.path.join(root, file))
+        # Recursively find all events files, using the file types cached by scandir
+        root = str(Path(directory))
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = listings.get(current)
+                if entries is None:
+                    with os.scandir(current) as it:
+                        entries = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in it]
+                    listings[current] = entries
+            except FileNotFoundError:
+                if current == root:
+                    print(f"Warning: directory does not exist: {directory}")
+                continue
+            except OSError:
+                # Unreadable directory; skip it like os.walk does
+                continue
+            subdirs = []
+            for name, is_dir in entries:
+                path = os.path.join(current, name)
+                if is_dir:
+                    subdirs.append(path)
+                elif name.startswith("events.out.tfevents"):
+                    tb_files.append(path)
+            # Visit subdirectories in listing order
+            stack.extend(reversed(subdirs))
 
     return tb_files
 
 
-def load_tb_data(tb_files, base_directories, max_step=None):
+def _load_one(log_dir, base_paths, max_step=None, verbose=False):
+    """
+    Load scalar data from all TensorBoard event files in one log directory.
+
+    Args:
+        log_dir: absolute, unresolved log directory (pathlib.Path) containing event files
+        base_paths: (path, path + separator, name) tuples of the resolved base input
+            directories, used to compute relative paths
+        max_step: maximum step value to include (data beyond this step will be ignored)
+        verbose: print each directory as it is loaded
+
+    Returns:
+        list of (tag, run_data) tuples, where run_data is the dict stored in load_tb_data
+    """
+    if verbose:
+        print(f"Loading: {log_dir}")
+    results = []
+
+    # Find the best matching base directory and compute relative path; symlinks are
+    # only resolved for naming, never for choosing which files are loaded
+    run_name = None
+    log_str = str(log_dir.resolve())
+    for base_str, base_prefix, base_name in base_paths:
+        # Include base directory name to distinguish runs from different directories
+        if log_str == base_str:  # If log_dir is exactly the base_path
+            run_name = base_name
+            break
+        if log_str.startswith(base_prefix):  # If log_dir is inside the base_path
+            run_name = f"{base_name}/{os.path.relpath(log_str, base_str)}"
+            break
+
+    # If no base directory matches, use the full path
+    if run_name is None:
+        run_name = log_str
+
+    try:
+        # One EventAccumulator reads every event file in the directory, so runs
+        # split across files (e.g. after a restart) are combined; non-scalar
+        # payloads are skipped
+        ea = EventAccumulator(str(log_dir), size_guidance=SCALARS_ONLY_SIZE_GUIDANCE)
+        ea.Reload()
+
+        # Get all scalar tags
+        scalar_tags = ea.Tags()["scalars"]
+
+        for tag in scalar_tags:
+            # Read all events for this tag
+            events = ea.Scalars(tag)
+
+            if events:
+                n_events = len(events)
+                steps = np.fromiter((e.step for e in events), dtype=np.int64, count=n_events)
+                # Store steps as int32 when they fit; checked explicitly because older
+                # NumPy versions wrap out-of-range integers instead of raising
+                int32_range = np.iinfo(np.int32)
+                if steps.min() >= int32_range.min and steps.max() <= int32_range.max:
+                    steps = steps.astype(np.int32)
+                values = np.fromiter((e.value for e in events), dtype=np.float32, count=n_events)
+                walltimes = np.fromiter((e.wall_time for e in events), dtype=np.float64, count=n_events)
+
+                # Filter data beyond max_step if specified
+                if max_step is not None:
+                    mask = steps <= max_step
+                    if not mask.any():
+                        # Skip this tag if no data remains after filtering
+                        continue
+                    steps, values, walltimes = steps[mask], values[mask], walltimes[mask]
+
+                # Relative time in hours from the first event, used for the walltime x-axis
+                walltime_hours = (walltimes - walltimes[0]) / 3600.0
+
+                results.append((tag, {
+                    "steps": steps,
+                    "values": values,
+                    "walltimes": walltimes,
+                    "walltime_hours": walltime_hours,
+                    "run_name": run_name,
+                    "log_dir": str(log_dir)
+                }))
+
+    except (OSError, struct.error, DirectoryDeletedError, tf.errors.DataLossError) as e:
+        # Event files may be deleted, renamed or truncated while a run is being read;
+        # anything else is a real bug and should propagate
+        if not log_dir.exists():
+            print(f"Skipping directory removed during load: {log_dir}")
+        else:
+            print(f"Failed to load directory {log_dir}: {e}")
+
+    return results
+
+
+def load_tb_data(tb_files, base_directories, max_step=None, workers=1, verbose=False):
     """
     Load TensorBoard data.
 
@@ -49,82 +212,91 @@ def load_tb_data(tb_files, base_directories, max_step=None):
         tb_files: list of TensorBoard event file paths
         base_directories: base input directories, used to compute relative paths
         max_step: maximum step value to include (data beyond this step will be ignored)
+        workers: number of worker processes, each loading one log directory at a time
+            (default: 1, loads in-process; worth raising only for many large runs)
+        verbose: print each directory as it is loaded instead of showing a progress bar
 
     Returns:
-        dict: key is metric name, value is a list of (steps, values, walltimes, run_name)
+        dict: key is metric name, value is a list of (steps, values, walltimes, walltime_hours, run_name)
     """
     data = defaultdict(list)
 
-    # Convert base directories to absolute paths
-    base_paths = [Path(d).resolve() for d in base_directories]
+    # Convert base directories to absolute paths, precomputing the strings used for
+    # prefix matching against each log directory
+    base_paths = []
+    for d in base_directories:
+        base_path = Path(d).resolve()
+        base_str = str(base_path)
+        base_prefix = base_str if base_str.endswith(os.sep) else base_str + os.sep
+        base_paths.append((base_str, base_prefix, base_path.name))
+
+    # Group event files by their parent (log) directory, keeping discovery order
+    log_dirs = list(dict.fromkeys(Path(os.path.abspath(tb_file)).parent for tb_file in tb_files))
+
+    load_one = partial(_load_one, base_paths=base_paths, max_step=max_step, verbose=verbose)
+    n_workers = min(len(log_dirs), workers or 1)
+
+    def progress(iterable):
+        if verbose or tqdm is None:
+            return iterable
+        return tqdm(iterable, total=len(log_dirs), desc="Loading", unit="dir")
+
+    # Merge in directory order so that run order in each metric is deterministic
+    if n_workers > 1:
+        with multiprocessing.Pool(processes=n_workers) as pool:
+            for results in progress(pool.imap(load_one, log_dirs)):
+                for tag, run_data in results:
+                    data[tag].append(run_data)
+    else:
+        for log_dir in progress(log_dirs):
+            for tag, run_data in load_one(log_dir):
+                data[tag].append(run_data)
 
-    for tb_file in tb_files:
-        print(f"Loading: {tb_file}")
+    return data
 
-        # Parent directory of the event file (usually the log directory)
-        tb_file_path = Path(tb_file).resolve()
-        log_dir = tb_file_path.parent
 
-        # Find the best matching base directory and compute relative path
-        run_name = None
-        for base_path in base_paths:
-            try:
-                # Compute relative path to base directory
-                rel_path = log_dir.relative_to(base_path)
-                # Include base directory name to distinguish runs from different directories
-                base_name = base_path.name
-                if rel_path.parts:  # If there's a relative path
-                    run_name = f"{base_name}/{rel_path}"
-                else:  # If log_dir is exactly the base_path
-                    run_name = base_name
-                break
-            except ValueError:
-                # Not a subdirectory; try the next base directory
-                continue
+def _ema_dot(values, alpha):
+    """
+    Closed-form EMA for short series, using the cumulative weighted sum
+    y[t] = (1 - alpha)^t * (x[0] + sum_{k=1..t} alpha * (1 - alpha)^-k * x[k]).
+    """
+    powers = (1.0 - alpha) ** np.arange(values.size, dtype=np.float64)
+    scaled = alpha * values / powers
+    scaled[0] = values[0]
+    return np.cumsum(scaled) * powers
 
-        # If no base directory matches, use the full path
-        if run_name is None:
-            run_name = str(log_dir)
 
+def _get_scipy_lfilter():
+    """Import scipy.signal's lfilter on first use; returns None if scipy is missing."""
+    global _scipy_lfilter
+    if _scipy_lfilter is None:
         try:
-            # Create EventAccumulator and load data
-            ea = EventAccumulator(tb_file)
-            ea.Reload()
-
-            # Get all scalar tags
-            scalar_tags = ea.Tags()["scalars"]
-
-            for tag in scalar_tags:
-                # Read all events for this tag
-                events = ea.Scalars(tag)
-
-                if events:
-                    steps = [e.step for e in events]
-                    values = [e.value for e in events]
-                    walltimes = [e.wall_time for e in events]
-
-                    # Filter data beyond max_step if specified
-                    if max_step is not None:
-                        filtered_data = [(s, v, w) for s, v, w in zip(steps, values, walltimes) if s <= max_step]
-                        if filtered_data:
-                            steps, values, walltimes = zip(*filtered_data)
-                        else:
-                            # Skip this tag if no data remains after filtering
-                            continue
-
-                    data[tag].append({
-                        "steps": np.array(steps),
-                        "values": np.array(values),
-                        "walltimes": np.array(walltimes),
-                        "run_name": run_name,
-                        "file_path": tb_file
-                    })
+            from scipy.signal import lfilter, lfilter_zi
+        except ImportError:  # scipy is optional; fall back to the EMA loop
+            _scipy_lfilter = False
+        else:
+            _scipy_lfilter = (lfilter, lfilter_zi)
+    return _scipy_lfilter or None
 
-        except Exception as e:
-            print(f"Failed to load file {tb_file}: {e}")
-            continue
 
-    return data
+def _ema_core(values, alpha, out):
+    """EMA recurrence written into `out`; see _get_ema_core for the compiled version."""
+    out[0] = values[0]
+    for i in range(1, values.shape[0]):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+
+
+def _get_ema_core():
+    """JIT-compile _ema_core with numba on first use; plain Python if numba is missing."""
+    global _ema_core_jit
+    if _ema_core_jit is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; the EMA core then runs as plain Python
+            _ema_core_jit = False
+        else:
+            _ema_core_jit = njit(cache=True)(_ema_core)
+    return _ema_core_jit or _ema_core
 
 
 def smooth_values(values, method="ema", window=10):
@@ -142,21 +314,104 @@ def smooth_values(values, method="ema", window=10):
     if window is None or window <= 1:
         return values
 
+    # Keep float32 input as float32; anything else is smoothed in float64
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+
     if method == "ma":
-        kernel = np.ones(int(window), dtype=float) / float(window)
-        return np.convolve(values, kernel, mode="same")
+        if values.size == 0:
+            return values
+        # Boxcar average from a running sum, padded with edge values to keep the length
+        window = min(int(window), values.size)
+        cumsum = np.cumsum(np.insert(values, 0, 0.0), dtype=np.float64)
+        averaged = ((cumsum[window:] - cumsum[:-window]) / window).astype(values.dtype, copy=False)
+        return np.pad(averaged, (window // 2, window - 1 - window // 2), mode="edge")
 
     # Exponential moving average (default)
     alpha = 2.0 / (float(window) + 1.0)
-    smoothed = np.empty_like(values, dtype=float)
     if values.size == 0:
         return values
-    smoothed[0] = values[0]
-    for i in range(1, len(values)):
-        smoothed[i] = alpha * values[i] + (1.0 - alpha) * smoothed[i - 1]
+
+    if values.size <= EMA_DOT_MAX_POINTS:
+        return _ema_dot(values, alpha).astype(values.dtype, copy=False)
+
+    scipy_lfilter = _get_scipy_lfilter()
+    if scipy_lfilter is not None:
+        lfilter, lfilter_zi = scipy_lfilter
+        # Single-pole IIR filter y[i] = alpha * x[i] + (1 - alpha) * y[i-1],
+        # with the initial state chosen so that y[0] == x[0]
+        b = [alpha]
+        a = [1.0, -(1.0 - alpha)]
+        zi = (lfilter_zi(b, a) * values[0]).astype(values.dtype, copy=False)
+        smoothed, _ = lfilter(b, a, values, zi=zi)
+        return smoothed.astype(values.dtype, copy=False)
+
+    smoothed = np.empty_like(values)
+    _get_ema_core()(values, alpha, smoothed)
     return smoothed
 
 
+def lttb(xs, ys, n_out):
+    """
+    Downsample a curve with Largest-Triangle-Three-Buckets.
+
+    Buckets are selected in one vectorized pass: each bucket's triangle is anchored
+    on the average of the previous bucket (or the first point) rather than on the
+    point picked from it, which removes the sequential dependency between buckets.
+
+    Args:
+        xs: 1D numpy array of x values (sorted)
+        ys: 1D numpy array of y values
+        n_out: number of points to keep (>= 3)
+
+    Returns:
+        (xs, ys) tuple of downsampled numpy arrays
+    """
+    n = len(xs)
+    if n_out >= n or n_out < 3:
+        return xs, ys
+
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[:n - 1], starts) / sizes
+    mean_y = np.add.reduceat(y[:n - 1], starts) / sizes
+
+    # Triangle vertices outside each bucket: previous bucket average (or the first
+    # point) and next bucket average (or the last point)
+    prev_x = np.concatenate(([x[0]], mean_x[:-1]))
+    prev_y = np.concatenate(([y[0]], mean_y[:-1]))
+    next_x = np.concatenate((mean_x[1:], [x[-1]]))
+    next_y = np.concatenate((mean_y[1:], [y[-1]]))
+
+    bucket = np.repeat(np.arange(sizes.size), sizes)
+    inner_x = x[1:n - 1]
+    inner_y = y[1:n - 1]
+    areas = np.abs(
+        (prev_x[bucket] - next_x[bucket]) * (inner_y - prev_y[bucket])
+        - (prev_x[bucket] - inner_x) * (next_y[bucket] - prev_y[bucket])
+    )
+    # NaN areas (from NaN/inf values) must not prevent a bucket from being selected
+    areas = np.nan_to_num(areas, nan=-1.0)
+
+    # First point in each bucket whose area equals the bucket maximum
+    best = np.maximum.reduceat(areas, starts - 1)
+    candidates = np.flatnonzero(areas == best[bucket])
+    _, first = np.unique(bucket[candidates], return_index=True)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[1:-1] = candidates[first] + 1
+    keep[-1] = n - 1
+
+    return xs[keep], ys[keep]
+
+
 def create_visualization(
     data,
     output_path="tensorboard_visualization.png",
@@ -184,98 +439,124 @@ def create_visualization(
         print("No data to visualize")
         return
 
-    # Compute subplot count and layout
-    n_metrics = len(data)
-    n_cols = min(n_metrics, max_cols)
-    n_rows = (n_metrics + n_cols - 1) // n_cols
-
-    # Create the figure
-    fig_width = figsize_per_plot[0] * n_cols
-    fig_height = figsize_per_plot[1] * n_rows
-
-    fig = plt.figure(figsize=(fig_width, fig_height))
-    gs = GridSpec(n_rows, n_cols, figure=fig, hspace=0.4, wspace=0.3)
-
-    # Build a stable color map per run name
-    color_cycle = plt.rcParams.get("axes.prop_cycle", None)
-    colors = []
-    if color_cycle is not None:
-        colors = color_cycle.by_key().get("color", [])
-    if not colors:
-        colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
-    color_iter = itertools.cycle(colors)
-    run_color_map = {}
-
-    # Create a subplot for each metric
-    for idx, (metric_name, runs_data) in enumerate(sorted(data.items())):
-        row = idx // n_cols
-        col = idx % n_cols
-        ax = fig.add_subplot(gs[row, col])
-
-        # Plot data for each run
-        for run_data in runs_data:
-            steps = run_data["steps"]
-            values = run_data["values"]
-            walltimes = run_data["walltimes"]
-            run_name = run_data["run_name"]
-
-            # Choose x-axis data based on parameter
-            if x_axis == "walltime":
-                # Convert walltime to relative time in hours from the first event
-                if len(walltimes) > 0:
-                    x_data = (walltimes - walltimes[0]) / 3600.0  # Convert to hours
-                else:
-                    x_data = walltimes
-            else:
-                x_data = steps
-
-            run_color = run_color_map.get(run_name)
-            if run_color is None:
-                run_color = next(color_iter)
-                run_color_map[run_name] = run_color
-
-            if smooth_method and show_raw_and_smooth:
-                raw_line, = ax.plot(
-                    x_data,
-                    values,
-                    label="_nolegend_",
-                    color=run_color,
-                    alpha=0.35,
-                    linewidth=1.0 * font_scale,
-                )
-                smooth_values_arr = smooth_values(values, method=smooth_method, window=smooth_window)
-                ax.plot(
-                    x_data,
-                    smooth_values_arr,
-                    label=run_name,
-                    color=raw_line.get_color(),
-                    alpha=0.9,
-                    linewidth=1.6 * font_scale,
-                )
-                continue
-
-            if smooth_method:
-                values = smooth_values(values, method=smooth_method, window=smooth_window)
-
-            # Draw curve
-            ax.plot(x_data, values, label=run_name, color=run_color, alpha=0.8, linewidth=1.5 * font_scale)
-
-        # Set title and labels
-        ax.set_title(metric_name, fontsize=int(10 * font_scale), fontweight="bold")
+    # matplotlib is imported here rather than at module level so that loader
+    # processes, which re-import this module, never pay for it. Use the
+    # non-interactive Agg backend unless a window was requested, so that headless
+    # runs never load a GUI toolkit
+    import matplotlib
+
+    if not show and "matplotlib.pyplot" not in sys.modules:
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    from matplotlib.gridspec import GridSpec
+
+    # Simplify and chunk long polylines when rendering, for this figure only
+    with plt.rc_context(RENDER_RC_PARAMS):
+        # Compute subplot count and layout
+        n_metrics = len(data)
+        n_cols = min(n_metrics, max_cols)
+        n_rows = (n_metrics + n_cols - 1) // n_cols
+
+        # Create the figure
+        fig_width = figsize_per_plot[0] * n_cols
+        fig_height = figsize_per_plot[1] * n_rows
+
+        # Lay the grid out directly with fixed margins (in inches) instead of running a
+        # layout engine; the top margin leaves room for the figure title
+        fig = plt.figure(figsize=(fig_width, fig_height))
+        gs = GridSpec(
+            n_rows,
+            n_cols,
+            figure=fig,
+            left=min(0.8 * font_scale / fig_width, 0.4),
+            right=1.0 - min(0.3 / fig_width, 0.1),
+            bottom=min(0.6 * font_scale / fig_height, 0.4),
+            top=1.0 - min(0.7 * font_scale / fig_height, 0.4),
+            hspace=0.4,
+            wspace=0.3,
+        )
+
+        # Build a stable color map per run name
+        color_cycle = plt.rcParams.get("axes.prop_cycle", None)
+        colors = []
+        if color_cycle is not None:
+            colors = color_cycle.by_key().get("color", [])
+        if not colors:
+            colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+        all_runs = {run_data["run_name"] for runs_data in data.values() for run_data in runs_data}
+        run_color_map = {run_name: color for run_name, color in zip(sorted(all_runs), itertools.cycle(colors))}
+
+        # Do not draw more points than one subplot can resolve at the output DPI
+        max_points = int(figsize_per_plot[0] * 150 * 2)
+
+        # Axis labels and text styles are the same for every subplot
         x_label = "Wall Time (hours)" if x_axis == "walltime" else "Step"
-        ax.set_xlabel(x_label, fontsize=int(9 * font_scale))
-        ax.set_ylabel("Value", fontsize=int(9 * font_scale))
-        ax.grid(True, alpha=0.3)
-        ax.tick_params(labelsize=int(8 * font_scale))
-
-        # Show legend
-        ax.legend(fontsize=int(7 * font_scale), loc="best", framealpha=0.7)
-
-    # Set overall title
-    fig.suptitle("TensorBoard Metrics Visualization", fontsize=int(16 * font_scale), fontweight="bold", y=0.995)
-
-    # Save image
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
+        title_style = {"fontsize": int(10 * font_scale), "fontweight": "bold"}
+        label_style = {"fontsize": int(9 * font_scale)}
+        tick_size = int(8 * font_scale)
+        legend_size = int(7 * font_scale)
+
+        # Create a subplot for each metric
+        for idx, (metric_name, runs_data) in enumerate(sorted(data.items(), key=operator.itemgetter(0))):
+            row = idx // n_cols
+            col = idx % n_cols
+            ax = fig.add_subplot(gs[row, col])
+
+            # Plot data for each run
+            for run_data in runs_data:
+                values = run_data["values"]
+                run_name = run_data["run_name"]
+
+                # Choose x-axis data based on parameter
+                x_data = run_data["walltime_hours"] if x_axis == "walltime" else run_data["steps"]
+
+                run_color = run_color_map[run_name]
+
+                if smooth_method and show_raw_and_smooth:
+                    smooth_values_arr = smooth_values(values, method=smooth_method, window=smooth_window)
+                    raw_x, raw_values = lttb(x_data, values, max_points)
+                    ax.plot(
+                        raw_x,
+                        raw_values,
+                        label="_nolegend_",
+                        color=run_color,
+                        alpha=0.35,
+                        linewidth=1.0 * font_scale,
+                        rasterized=True,
+                    )
+                    ax.plot(
+                        *lttb(x_data, smooth_values_arr, max_points),
+                        label=run_name,
+                        color=run_color,
+                        alpha=0.9,
+                        linewidth=1.6 * font_scale,
+                        rasterized=True,
+                    )
+                    continue
+
+                if smooth_method:
+                    values = smooth_values(values, method=smooth_method, window=smooth_window)
+                x_data, values = lttb(x_data, values, max_points)
+
+                # Draw curve
+                ax.plot(x_data, values, label=run_name, color=run_color, alpha=0.8, linewidth=1.5 * font_scale, rasterized=True)
+
+            # Set title and labels
+            ax.set_title(metric_name, **title_style)
+            ax.set_xlabel(x_label, **label_style)
+            ax.set_ylabel("Value", **label_style)
+            ax.grid(True, alpha=0.3)
+            ax.tick_params(labelsize=tick_size)
+
+            # Show legend
+            ax.legend(fontsize=legend_size, loc="best", framealpha=0.7)
+
+        # Set overall title
+        fig.suptitle("TensorBoard Metrics Visualization", fontsize=int(16 * font_scale), fontweight="bold", y=0.995)
+
+        # Save image; the figure size is already known, so skip the extra "tight" layout pass
+        fig.savefig(output_path, dpi=150)
     print(f"\nVisualization saved to: {output_path}")
     print(f"Figure size: {fig_width}x{fig_height} inches")
     print(f"Total metrics plotted: {n_metrics}")
@@ -314,6 +595,8 @@ Examples:
     parser.add_argument("--show-both", action="store_true", help="Show raw curve and smoothed curve together (requires --smooth)")
     parser.add_argument("--x-axis", choices=["step", "walltime"], default="step", help="X-axis type: step (default) or walltime (in hours)")
     parser.add_argument("--max-step", type=int, default=None, help="Maximum step value to include (data beyond this step will be ignored)")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes used to load log directories (default: 1, load in-process)")
+    parser.add_argument("--verbose", action="store_true", help="Print each log directory as it is loaded")
     parser.add_argument("--font-scale", type=float, default=1.0, help="Font size scaling factor (default: 1.0, try 1.5 for larger fonts or 0.8 for smaller)")
 
     args = parser.parse_args()
@@ -335,7 +618,7 @@ Examples:
     print()
 
     # Load data, passing base directories to compute relative paths
-    data = load_tb_data(tb_files, args.directories, max_step=args.max_step)
+    data = load_tb_data(tb_files, args.directories, max_step=args.max_step, workers=args.workers, verbose=args.verbose)
 
     if not data:
         print("Error: failed to load any data")
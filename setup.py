@@ -20,6 +20,10 @@ setup(
     py_modules=["main"],
     python_requires=">=3.6",  # 放宽到 Python 3.6+
     install_requires=requirements,
+    extras_require={
+        "fast": ["scipy", "crc32c", "tqdm"],
+        "jit": ["numba"],
+    },
     entry_points={
         "console_scripts": [
             "tb-visualizer=main:main",
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from main import lttb
+
+
+@pytest.mark.parametrize("n, n_out", [(10, 3), (10, 9), (1000, 100), (12345, 2400)])
+def test_lttb_output_shape(n, n_out):
+    rng = np.random.default_rng(0)
+    xs = np.arange(n)
+    ys = rng.normal(size=n).astype(np.float32)
+
+    out_x, out_y = lttb(xs, ys, n_out)
+
+    assert len(out_x) == len(out_y) == n_out
+    assert out_x[0] == xs[0] and out_x[-1] == xs[-1]
+    assert out_y[0] == ys[0] and out_y[-1] == ys[-1]
+    assert np.all(np.diff(out_x) > 0)
+    assert out_y.dtype == ys.dtype
+
+
+def test_lttb_keeps_spike():
+    xs = np.arange(10000)
+    ys = np.sin(xs / 300.0)
+    ys[5000] = 5.0
+
+    _, out_y = lttb(xs, ys, 100)
+
+    assert out_y.max() == 5.0
+
+
+def test_lttb_short_input_unchanged():
+    xs = np.arange(5)
+    ys = np.arange(5, dtype=np.float64)
+
+    out_x, out_y = lttb(xs, ys, 100)
+
+    assert out_x is xs and out_y is ys
+
+
+def test_lttb_nan_values():
+    xs = np.arange(1000)
+    ys = np.linspace(0.0, 1.0, 1000)
+    ys[100:200] = np.nan
+
+    out_x, _ = lttb(xs, ys, 50)
+
+    assert len(out_x) == 50
+    assert np.all(np.diff(out_x) > 0)
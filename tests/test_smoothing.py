@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+import main
+from main import EMA_DOT_MAX_POINTS, smooth_values
+
+
+def ema_reference(values, window):
+    alpha = 2.0 / (window + 1.0)
+    values = values.astype(np.float64)
+    out = np.empty_like(values)
+    out[0] = values[0]
+    for i in range(1, len(values)):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@pytest.mark.parametrize("n", [EMA_DOT_MAX_POINTS, EMA_DOT_MAX_POINTS + 1])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("window", [2, 10, 1000])
+def test_ema_matches_recurrence(n, dtype, window):
+    rng = np.random.default_rng(n + window)
+    values = (rng.normal(size=n) * 100.0).astype(dtype)
+
+    smoothed = smooth_values(values, method="ema", window=window)
+
+    assert smoothed.shape == values.shape
+    assert smoothed.dtype == dtype
+    rtol = 1e-5 if dtype == np.float32 else 1e-10
+    np.testing.assert_allclose(smoothed, ema_reference(values, window), rtol=rtol, atol=rtol * 100.0)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_ema_without_scipy_matches_recurrence(monkeypatch, dtype):
+    monkeypatch.setattr(main, "_scipy_lfilter", False)
+    values = np.random.default_rng(0).normal(size=500).astype(dtype)
+
+    smoothed = smooth_values(values, method="ema", window=10)
+
+    assert smoothed.dtype == dtype
+    np.testing.assert_allclose(smoothed, ema_reference(values, 10), rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("window", [2, 3, 10, 11])
+def test_ma_interior_matches_convolve(window):
+    values = np.random.default_rng(window).normal(size=200)
+
+    smoothed = smooth_values(values, method="ma", window=window)
+    expected = np.convolve(values, np.ones(window) / window, mode="same")
+
+    assert smoothed.shape == values.shape
+    np.testing.assert_allclose(smoothed[window:-window], expected[window:-window])
+
+
+@pytest.mark.parametrize("n", [1, 3, 7])
+def test_ma_window_longer_than_series(n):
+    values = np.arange(n, dtype=np.float64)
+
+    smoothed = smooth_values(values, method="ma", window=50)
+
+    assert smoothed.shape == values.shape
+    np.testing.assert_allclose(smoothed, np.full(n, values.mean()))
+
+
+@pytest.mark.parametrize("dtype, expected", [(np.float32, np.float32), (np.float64, np.float64), (np.int64, np.float64)])
+@pytest.mark.parametrize("method", ["ma", "ema"])
+def test_smoothing_output_dtype(method, dtype, expected):
+    values = np.arange(100).astype(dtype)
+
+    smoothed = smooth_values(values, method=method, window=10)
+
+    assert smoothed.dtype == expected